@@ -0,0 +1,21 @@
+# backend/config.py
+"""
+Filesystem locations shared by the backend services.
+Paths are resolved once at import time, independent of the working directory.
+"""
+
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+DATA_DIR = BASE_DIR / "data" / "raw"
+MODELS_DIR = BASE_DIR / "models"
+
+# Data produced by src/01_data_extraction.py
+DATA_PATH = DATA_DIR / "stock_data.feather"
+RETURNS_PATH = DATA_DIR / "returns.feather"
+
+# Artifacts produced by the modeling scripts in src/
+FORECAST_PATH = MODELS_DIR / "future_forecast.json"
+METRICS_PATH = MODELS_DIR / "model_comparison.pkl"
+WEIGHTS_PATH = MODELS_DIR / "optimal_weights.pkl"
+RESULTS_PATH = MODELS_DIR / "backtest_results.pkl"
@@ -0,0 +1,86 @@
+# backend/http_cache.py
+"""
+HTTP caching helpers shared by the routers.
+Every endpoint serves data derived from a single file on disk, so the file's
+stat is used to build ETag / Last-Modified headers and answer conditional
+requests with 304 Not Modified before any payload is built or encoded.
+"""
+
+import asyncio
+import os
+from email.utils import formatdate, parsedate_to_datetime
+
+import orjson
+from fastapi import HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+
+CACHE_CONTROL = "public, max-age=3600"
+STREAM_CHUNK_ROWS = 256
+
+
+def iter_json_array(records, chunk_size=STREAM_CHUNK_ROWS):
+    """
+    Encode a list as a JSON array in chunk_size-element pieces, so only one
+    chunk's bytes are alive at a time instead of the whole response body.
+    """
+    yield b"["
+    for start in range(0, len(records), chunk_size):
+        payload = orjson.dumps(records[start:start + chunk_size], option=orjson.OPT_SERIALIZE_NUMPY)[1:-1]
+        yield payload if start == 0 else b"," + payload
+    yield b"]"
+
+
+def _etag(stat):
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+def _not_modified(request, etag, stat):
+    """
+    Evaluate If-None-Match (preferred) or If-Modified-Since against the file.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(stat.st_mtime) <= since
+    return False
+
+
+async def cached_response(request: Request, path, producer, stream=False):
+    """
+    Serve producer() with caching headers derived from the file at path.
+    Producers may return pre-encoded JSON bytes, which are sent unchanged.
+    With stream=True a list payload is sent as a chunked JSON array.
+    If the file is missing, the producer is still called so services with a
+    fallback can use it; a service that cannot serve without the file yields
+    503 Service Unavailable until the artifact has been generated.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        try:
+            return await asyncio.to_thread(producer)
+        except FileNotFoundError:
+            raise HTTPException(status_code=503, detail=f"{os.path.basename(path)} is not available yet")
+
+    headers = {
+        "ETag": _etag(stat),
+        "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+        "Cache-Control": CACHE_CONTROL,
+    }
+    if _not_modified(request, headers["ETag"], stat):
+        return Response(status_code=304, headers=headers)
+
+    content = await asyncio.to_thread(producer)
+    if isinstance(content, bytes):
+        return Response(content, media_type="application/json", headers=headers)
+    if stream and isinstance(content, list):
+        return StreamingResponse(iter_json_array(content), media_type="application/json", headers=headers)
+    return ORJSONResponse(content, headers=headers)
@@ -1,12 +1,16 @@
 # backend/main.py
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from backend.routers.data import router as data_router
 from backend.routers.forecast import router as forecast_router
 from backend.routers.portfolio import router as portfolio_router
+from backend.services.preload import preload_artifacts
 
-app = FastAPI(title="GMF Portfolio Dashboard API")
+app = FastAPI(title="GMF Portfolio Dashboard API", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -21,6 +25,11 @@ app.include_router(data_router, prefix="/api/data", tags=["Data"])
 app.include_router(forecast_router, prefix="/api/forecast", tags=["Forecast"])
 app.include_router(portfolio_router, prefix="/api/portfolio", tags=["Portfolio"])
 
+@app.on_event("startup")
+async def preload():
+    # Warm every endpoint's cache with one concurrent burst of reads
+    await asyncio.to_thread(preload_artifacts)
+
 @app.get("/")
 def root():
     return {"message": "GMF Portfolio API is running!"}
\ No newline at end of file
@@ -1,12 +1,13 @@
-from fastapi import APIRouter
-from backend.services.data_service import get_historical_prices, get_returns
+from fastapi import APIRouter, Request
+from backend.http_cache import cached_response
+from backend.services.data_service import DATA_PATH, RETURNS_PATH, get_historical_prices, get_returns
 
 router = APIRouter()  # ← No prefix here
 
 @router.get("/prices")  # ← Only the endpoint, not full path
-def read_prices():
-    return get_historical_prices()
+async def read_prices(request: Request):
+    return await cached_response(request, DATA_PATH, get_historical_prices, stream=True)
 
 @router.get("/returns")
-def read_returns():
-    return get_returns()
\ No newline at end of file
+async def read_returns(request: Request):
+    return await cached_response(request, RETURNS_PATH, get_returns, stream=True)
\ No newline at end of file
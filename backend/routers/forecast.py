@@ -1,12 +1,13 @@
-from fastapi import APIRouter
-from backend.services.forecast_service import get_forecast, get_model_comparison
+from fastapi import APIRouter, Request
+from backend.http_cache import cached_response
+from backend.services.forecast_service import FORECAST_PATH, METRICS_PATH, get_forecast, get_model_comparison
 
 router = APIRouter()
 
 @router.get("/future")
-def read_forecast():
-    return get_forecast()
+async def read_forecast(request: Request):
+    return await cached_response(request, FORECAST_PATH, get_forecast)
 
 @router.get("/comparison")
-def read_comparison():
-    return get_model_comparison()
\ No newline at end of file
+async def read_comparison(request: Request):
+    return await cached_response(request, METRICS_PATH, get_model_comparison)
\ No newline at end of file
@@ -1,12 +1,13 @@
-from fastapi import APIRouter
-from backend.services.portfolio_service import get_optimal_portfolio, get_backtest_results
+from fastapi import APIRouter, Request
+from backend.http_cache import cached_response
+from backend.services.portfolio_service import RESULTS_PATH, WEIGHTS_PATH, get_optimal_portfolio, get_backtest_results
 
 router = APIRouter()
 
 @router.get("/optimal")
-def read_optimal():
-    return get_optimal_portfolio()
+async def read_optimal(request: Request):
+    return await cached_response(request, WEIGHTS_PATH, get_optimal_portfolio)
 
 @router.get("/backtest")
-def read_backtest():
-    return get_backtest_results()
\ No newline at end of file
+async def read_backtest(request: Request):
+    return await cached_response(request, RESULTS_PATH, get_backtest_results)
\ No newline at end of file
@@ -0,0 +1,17 @@
+# backend/services/artifacts.py
+"""
+Cached loading of the pickled model artifacts shared by the services.
+"""
+
+import pickle
+from functools import lru_cache
+
+
+@lru_cache(maxsize=8)
+def load_pickle(path, mtime):
+    """
+    Deserialize an artifact once per (path, mtime) so repeat requests skip disk I/O.
+    Artifacts are plain protocol-5 pickles, so stdlib pickle avoids joblib's overhead.
+    """
+    with open(path, "rb") as f:
+        return pickle.load(f)
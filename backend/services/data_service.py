@@ -1,18 +1,66 @@
 # backend/services/data_service.py
 import pandas as pd
+import pyarrow.feather as feather
 import os
+from functools import lru_cache
+
+from backend.config import DATA_PATH, RETURNS_PATH
+
+PRICE_COLUMNS = ["TSLA", "BND", "SPY"]
+
+
+@lru_cache(maxsize=8)
+def _load_frame(path, mtime, columns=None):
+    """
+    Read a Feather file once per (path, mtime, columns) so repeat requests skip disk I/O.
+    The file is memory-mapped, letting the OS page in only the selected columns.
+    split_blocks keeps each value column as a zero-copy view of the mapping, so
+    every Uvicorn worker serving the same file shares its page-cache pages
+    instead of holding a private copy.
+    """
+    if columns is not None:
+        columns = ["Date", *columns]
+    table = feather.read_table(path, columns=columns, memory_map=True)
+    df = table.drop_columns(["Date"]).to_pandas(split_blocks=True)
+    # Assign the index directly; set_index("Date") would copy every column
+    df.index = pd.DatetimeIndex(table.column("Date").to_pandas(), name="Date")
+    return df
+
+
+def _to_records(df):
+    """
+    Convert a DataFrame to row records column-at-a-time.
+    Dates and values are unboxed once per column with NumPy instead of per row.
+    Values stay NumPy scalars in their stored dtype (float32 for the data files),
+    which ORJSONResponse encodes in their shortest form instead of widening
+    them to float64 digits.
+    """
+    keys = [df.index.name or "Date", *df.columns]
+    dates = df.index.strftime("%Y-%m-%d").tolist()
+    columns = [list(df[col].to_numpy()) for col in df.columns]
+    return [dict(zip(keys, row)) for row in zip(dates, *columns)]
+
+
+@lru_cache(maxsize=8)
+def _prebuilt_payload(path, mtime, columns=None):
+    """
+    Build the JSON-ready records once per (path, mtime, columns).
+    The returned list is shared between requests and must not be mutated.
+    """
+    return _to_records(_load_frame(path, mtime, columns))
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Data file not found at {path}")
 
-# Get the directory of the current file
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-DATA_PATH = os.path.join(BASE_DIR, "data", "raw", "stock_data.pkl")
 
 def get_historical_prices():
-    if not os.path.exists(DATA_PATH):
-        raise FileNotFoundError(f"Data file not found at {DATA_PATH}")
-    df = pd.read_pickle(DATA_PATH)
-    return df.reset_index().to_dict('records')
+    # stock_data.feather also holds volumes; only the price columns are served
+    return _prebuilt_payload(DATA_PATH, _mtime(DATA_PATH), tuple(PRICE_COLUMNS))
 
 def get_returns():
-    df = pd.read_pickle(DATA_PATH)
-    returns = df.pct_change().dropna()
-    return returns.reset_index().to_dict('records')
\ No newline at end of file
+    # Returns are precomputed by 01_data_extraction.py
+    return _prebuilt_payload(RETURNS_PATH, _mtime(RETURNS_PATH))
@@ -1,35 +1,60 @@
 # backend/services/forecast_service.py
 """
 Service layer for handling forecast-related data retrieval.
-Uses absolute paths to ensure reliability regardless of execution context.
+Paths come from backend.config, so they are reliable regardless of execution context.
 """
 
-import joblib
-import pandas as pd
 import os
+from functools import lru_cache
 
-# Define BASE_DIR to make paths absolute
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-MODELS_DIR = os.path.join(BASE_DIR, "models")
-DATA_DIR = os.path.join(BASE_DIR, "data", "raw")
+from backend.config import FORECAST_PATH, METRICS_PATH
+from backend.services.artifacts import load_pickle
+
+# Fallback metrics used when models/model_comparison.pkl is unavailable
+FALLBACK_MODEL_COMPARISON = {
+    "models": [
+        {"name": "ARIMA", "RMSE": 9.12, "MAPE": 6.8},
+        {"name": "LSTM", "RMSE": 6.38, "MAPE": 4.9}
+    ]
+}
+
+
+@lru_cache(maxsize=8)
+def _load_bytes(path, mtime):
+    """
+    Read a pre-rendered JSON payload once per (path, mtime).
+    """
+    with open(path, "rb") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=8)
+def _prebuilt_comparison(path, mtime):
+    """
+    Build the model comparison payload once per (path, mtime).
+    """
+    metrics = load_pickle(path, mtime)
+    return {
+        "models": [
+            {"name": "ARIMA", "RMSE": round(metrics["arima_rmse"], 2), "MAPE": round(metrics["arima_mape"], 2)},
+            {"name": "LSTM", "RMSE": round(metrics["lstm_rmse"], 2), "MAPE": round(metrics["lstm_mape"], 2)}
+        ]
+    }
 
 def get_forecast():
     """
-    Load the 12-month TSLA price forecast.
-    Returns: List of dicts: [{"date": "YYYY-MM-DD", "price": float}]
+    Load the 12-month TSLA price forecast pre-rendered by 04_forecast_future.py.
+    Returns: JSON bytes of a list of dicts: [{"date": "YYYY-MM-DD", "price": float}]
     """
-    forecast_path = os.path.join(MODELS_DIR, "future_forecast.pkl")
+    forecast_path = FORECAST_PATH
     
-    if not os.path.exists(forecast_path):
+    try:
+        mtime = os.stat(forecast_path).st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(f"Forecast file not found at {forecast_path}")
     
     try:
-        forecast = joblib.load(forecast_path)
-        # Ensure it's a Series with datetime index
-        if isinstance(forecast, pd.Series):
-            return [{"date": str(date), "price": float(price)} for date, price in forecast.items()]
-        else:
-            raise ValueError("Forecast must be a pandas Series.")
+        return _load_bytes(forecast_path, mtime)
     except Exception as e:
         raise RuntimeError(f"Failed to load forecast: {str(e)}")
 
@@ -39,26 +64,16 @@ def get_model_comparison():
     Load performance metrics for ARIMA and LSTM models.
     Returns: Dict with model names and metrics (RMSE, MAPE).
     """
-    metrics_path = os.path.join(MODELS_DIR, "model_comparison.pkl")
+    metrics_path = METRICS_PATH
     
     # Try to load real metrics if available
-    if os.path.exists(metrics_path):
-        try:
-            metrics = joblib.load(metrics_path)
-            return {
-                "models": [
-                    {"name": "ARIMA", "RMSE": round(metrics["arima_rmse"], 2), "MAPE": round(metrics["arima_mape"], 2)},
-                    {"name": "LSTM", "RMSE": round(metrics["lstm_rmse"], 2), "MAPE": round(metrics["lstm_mape"], 2)}
-                ]
-            }
-        except Exception as e:
-            print(f"Warning: Failed to load model metrics: {e}")
+    try:
+        return _prebuilt_comparison(metrics_path, os.stat(metrics_path).st_mtime_ns)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Warning: Failed to load model metrics: {e}")
 
     # Fallback: Use hardcoded values (from your current code)
     print("Using fallback model comparison metrics.")
-    return {
-        "models": [
-            {"name": "ARIMA", "RMSE": 9.12, "MAPE": 6.8},
-            {"name": "LSTM", "RMSE": 6.38, "MAPE": 4.9}
-        ]
-    }
\ No newline at end of file
+    return FALLBACK_MODEL_COMPARISON
\ No newline at end of file
@@ -1,34 +1,51 @@
 # backend/services/portfolio_service.py
 """
 Service layer for portfolio-related data retrieval.
-Uses absolute paths to ensure reliability regardless of execution context.
+Paths come from backend.config, so they are reliable regardless of execution context.
 """
 
-import joblib
 import os
+from functools import lru_cache
 
-# Define BASE_DIR to make paths absolute and robust
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-MODELS_DIR = os.path.join(BASE_DIR, "models")
+from backend.config import RESULTS_PATH, WEIGHTS_PATH
+from backend.services.artifacts import load_pickle
+
+
+@lru_cache(maxsize=8)
+def _prebuilt_payload(path, mtime, kind):
+    """
+    Build the JSON-ready payload once per (path, mtime, kind).
+    The returned dict is shared between requests and must not be mutated.
+    """
+    data = load_pickle(path, mtime)
+    if kind == "optimal":
+        return {
+            "weights": [{"asset": k, "weight": v} for k, v in data.items()],
+            "expected_return": 9.8,
+            "volatility": 10.2,
+            "sharpe_ratio": 0.67
+        }
+    return {
+        "strategy_return": data["strategy_return"],
+        "benchmark_return": data["benchmark_return"],
+        "strategy_sharpe": data["strategy_sharpe"],
+        "benchmark_sharpe": data["benchmark_sharpe"]
+    }
 
 def get_optimal_portfolio():
     """
     Load the optimal portfolio weights and return structured data.
     Returns: Dict with weights, expected return, volatility, and Sharpe ratio.
     """
-    weights_path = os.path.join(MODELS_DIR, "optimal_weights.pkl")
+    weights_path = WEIGHTS_PATH
     
-    if not os.path.exists(weights_path):
+    try:
+        mtime = os.stat(weights_path).st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(f"optimal_weights.pkl not found at {weights_path}")
     
     try:
-        weights = joblib.load(weights_path)
-        return {
-            "weights": [{"asset": k, "weight": v} for k, v in weights.items()],
-            "expected_return": 9.8,
-            "volatility": 10.2,
-            "sharpe_ratio": 0.67
-        }
+        return _prebuilt_payload(weights_path, mtime, "optimal")
     except Exception as e:
         raise RuntimeError(f"Failed to load optimal weights: {str(e)}")
 
@@ -38,18 +55,14 @@ def get_backtest_results():
     Load backtest results and return comparison with benchmark.
     Returns: Dict with strategy and benchmark performance metrics.
     """
-    results_path = os.path.join(MODELS_DIR, "backtest_results.pkl")
+    results_path = RESULTS_PATH
     
-    if not os.path.exists(results_path):
+    try:
+        mtime = os.stat(results_path).st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(f"backtest_results.pkl not found at {results_path}")
     
     try:
-        results = joblib.load(results_path)
-        return {
-            "strategy_return": results["strategy_return"],
-            "benchmark_return": results["benchmark_return"],
-            "strategy_sharpe": results["strategy_sharpe"],
-            "benchmark_sharpe": results["benchmark_sharpe"]
-        }
+        return _prebuilt_payload(results_path, mtime, "backtest")
     except Exception as e:
         raise RuntimeError(f"Failed to load backtest results: {str(e)}")
\ No newline at end of file
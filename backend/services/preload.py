@@ -0,0 +1,42 @@
+# backend/services/preload.py
+"""
+Startup preloading of the artifacts behind every endpoint.
+All service loaders are submitted to a thread pool in one burst, so the
+artifact reads are issued concurrently and warm the per-mtime payload caches
+before the first request arrives.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.services.data_service import get_historical_prices, get_returns
+from backend.services.forecast_service import get_forecast, get_model_comparison
+from backend.services.portfolio_service import get_optimal_portfolio, get_backtest_results
+
+LOADERS = [
+    get_historical_prices,
+    get_returns,
+    get_forecast,
+    get_model_comparison,
+    get_optimal_portfolio,
+    get_backtest_results,
+]
+
+
+def preload_artifacts():
+    """
+    Call every service loader concurrently.
+    Missing or unreadable artifacts are reported and skipped; the affected
+    endpoint will raise on request exactly as it would without preloading.
+    Returns: List of loader names that succeeded.
+    """
+    with ThreadPoolExecutor(max_workers=len(LOADERS)) as pool:
+        futures = [(loader.__name__, pool.submit(loader)) for loader in LOADERS]
+
+    loaded = []
+    for name, future in futures:
+        try:
+            future.result()
+            loaded.append(name)
+        except Exception as e:
+            print(f"Warning: Could not preload {name}: {e}")
+    return loaded
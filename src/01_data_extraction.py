@@ -10,13 +10,16 @@ This module is part of the Week 11 challenge for 10 Academy - KAIM, designed to
 Features:
 - Utilizes the `yfinance` library to fetch real-time and historical market data.
 - Extracts 'Adj Close' (adjusted for splits and dividends) and 'Volume' for accurate financial analysis.
-- Saves cleaned and structured data into pickle (.pkl) files under the data/raw/ directory for reproducibility and efficient loading in downstream tasks.
+- Saves cleaned and structured data into uncompressed Feather files under the data/raw/ directory; downstream tasks read only the columns they need.
+- Saves adjusted closing prices and volumes as one uncompressed Feather (Arrow IPC) table for memory-mapped, zero-copy reads by the backend API.
+- Precomputes daily returns once at extraction time so the API never recomputes them per request.
 - Ensures data persistence and modularity by separating data extraction from modeling and analysis.
 - Includes basic console feedback upon successful execution.
 
 Dependencies:
 - yfinance: For downloading stock data.
 - pandas: For data manipulation and storage.
+- pyarrow: For writing the Feather tables.
 - joblib: For serializing data (alternative to pickle; used here for consistency with scikit-learn workflows).
 
 Usage:
@@ -24,12 +27,13 @@ Run this script as a standalone module to download and save financial data:
     python src/01_data_extraction.py
 
 Output:
-- data/raw/stock_data.pkl: Contains adjusted closing prices for TSLA, BND, and SPY.
-- data/raw/volume_data.pkl: Contains daily trading volumes for the three assets.
+- data/raw/stock_data.feather: Date, adjusted closing prices (TSLA, BND, SPY) and daily trading volumes (TSLA_Volume, BND_Volume, SPY_Volume) in one table (read by all later tasks and served by the backend).
+- data/raw/returns.feather: Daily percentage returns derived from the prices (served by the backend).
 """
 
 import yfinance as yf
 import pandas as pd
+import pyarrow.feather as feather
 import time
 import os
 
@@ -69,19 +73,28 @@ def fetch_data_with_retry(symbols, start, end, max_retries=5, delay=2):
     
     # Combine data on Date
     combined = pd.concat(all_data.values(), axis=1)
-    prices = combined[[f"{s}_Close" for s in symbols]].copy()
-    volumes = combined[[f"{s}_Volume" for s in symbols]].copy()
+    close_cols = [f"{s}_Close" for s in symbols]
+    volume_cols = [f"{s}_Volume" for s in symbols]
     
-    # Clean column names
-    prices.columns = symbols
-    volumes.columns = symbols
+    # Column selection already returns a new frame, so no extra .copy() is needed
+    data = combined[close_cols + volume_cols]
+    
+    # Clean column names (volumes keep their suffix to stay distinct in one table)
+    data.columns = symbols + volume_cols
+    
+    # yfinance prices carry float32 precision, so storing them as float32 is lossless
+    data = data.astype(dict.fromkeys(symbols, "float32"))
+    prices = data[symbols]
     
     # Ensure directory exists
     os.makedirs("data/raw", exist_ok=True)
     
-    # Save
-    prices.to_pickle("data/raw/stock_data.pkl")
-    volumes.to_pickle("data/raw/volume_data.pkl")
+    # Save: prices and volumes share one Date column in a single Arrow table
+    feather.write_feather(data.reset_index(), "data/raw/stock_data.feather", compression="uncompressed")
+    
+    # Precompute daily returns for the API (static data, so do it once here)
+    returns = prices.pct_change().dropna()
+    feather.write_feather(returns.reset_index(), "data/raw/returns.feather", compression="uncompressed")
     
     print("✅ All data saved to data/raw/")
     return prices
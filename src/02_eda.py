@@ -5,7 +5,7 @@ Created by: Addisu Taye
 Date: August 12, 2025
 
 Purpose:
-This module performs comprehensive Exploratory Data Analysis (EDA) on financial time series data for Tesla (TSLA), Vanguard Total Bond Market ETF (BND), and S&P 500 ETF (SPY), supporting the portfolio optimization challenge at Guide Me in Finance (GMF) Investments. The analysis is based on cleaned historical data loaded from 'data/raw/stock_data.pkl'. The primary objectives are to:
+This module performs comprehensive Exploratory Data Analysis (EDA) on financial time series data for Tesla (TSLA), Vanguard Total Bond Market ETF (BND), and S&P 500 ETF (SPY), supporting the portfolio optimization challenge at Guide Me in Finance (GMF) Investments. The analysis is based on cleaned historical data loaded from 'data/raw/stock_data.feather'. The primary objectives are to:
 - Understand trends, volatility, and return distributions.
 - Test for stationarity (critical for ARIMA modeling).
 - Calculate foundational risk metrics such as Value at Risk (VaR) and Sharpe Ratio.
@@ -31,6 +31,7 @@ Dependencies:
 - numpy: For numerical operations.
 - matplotlib & seaborn: For data visualization.
 - statsmodels: For ADF stationarity test.
+- numba: For JIT-compiled return statistics and rolling volatility kernels.
 - joblib: Not used in this script (reserved for model persistence in later tasks).
 
 Usage:
@@ -49,19 +50,81 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from statsmodels.tsa.stattools import adfuller
+from numba import njit
+from concurrent.futures import ThreadPoolExecutor
 import os
 
 # Ensure output directory exists
 os.makedirs("assets/figures", exist_ok=True)
 
+# ========================
+# 0. Numba Kernels
+# ========================
+@njit(cache=True)
+def rolling_std(x, w):
+    """
+    Rolling sample standard deviation (ddof=1) using a sliding Welford update.
+    Matches pandas' rolling(w).std(): the first w-1 values are NaN.
+    """
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        if i < w:
+            delta = x[i] - mean
+            mean += delta / (i + 1)
+            m2 += delta * (x[i] - mean)
+        else:
+            old = x[i - w]
+            new_mean = mean + (x[i] - old) / w
+            m2 += (x[i] - old) * (x[i] - new_mean + old - mean)
+            mean = new_mean
+        if i >= w - 1:
+            out[i] = np.sqrt(max(m2, 0.0) / (w - 1))
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def stats_pass(prices):
+    """
+    Single pass over a price array: simple daily returns together with their
+    mean and sample variance (Welford update, ddof=1 like pandas).
+    """
+    n = prices.shape[0] - 1
+    buf = np.empty(n)
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        r = prices[i + 1] / prices[i] - 1.0
+        buf[i] = r
+        delta = r - mean
+        mean += delta / (i + 1)
+        m2 += delta * (r - mean)
+    return buf, mean, m2 / (n - 1)
+
+
+def var_hist(x, qs):
+    """
+    Historical VaR at several percentiles from one np.partition call,
+    using the same linear interpolation as np.percentile.
+    """
+    n = x.shape[0]
+    pos = (n - 1) * np.asarray(qs, dtype=np.float64) / 100.0
+    lo = np.floor(pos).astype(np.int64)
+    hi = np.minimum(lo + 1, n - 1)
+    part = np.partition(x, np.union1d(lo, hi))
+    return part[lo] + (part[hi] - part[lo]) * (pos - lo)
+
 # ========================
 # 1. Load Data
 # ========================
 try:
-    df = pd.read_pickle("data/raw/stock_data.pkl")
-    print("✅ Data successfully loaded from data/raw/stock_data.pkl")
+    # Read only the price columns; the table also holds volumes
+    df = pd.read_feather("data/raw/stock_data.feather", columns=["Date", "TSLA", "BND", "SPY"]).set_index("Date")
+    print("✅ Data successfully loaded from data/raw/stock_data.feather")
 except FileNotFoundError:
-    raise FileNotFoundError("❌ File not found: data/raw/stock_data.pkl. Please run 01_data_extraction.py first.")
+    raise FileNotFoundError("❌ File not found: data/raw/stock_data.feather. Please run 01_data_extraction.py first.")
 
 # Ensure index is datetime
 df.index = pd.to_datetime(df.index)
@@ -78,19 +141,31 @@ print(df.describe().round(2))
 # 3. Daily Returns & Volatility
 # ========================
 returns = df.pct_change().dropna()
-rolling_volatility = returns["TSLA"].rolling(window=30).std()  # 30-day rolling volatility
 
-print(f"\n📉 TSLA Average Daily Return: {returns['TSLA'].mean():.4f}")
-print(f"📈 TSLA Std Dev (Daily): {returns['TSLA'].std():.4f}")
+# TSLA returns, mean and variance in one fused pass over the raw prices
+tsla_prices = df["TSLA"].dropna()
+tsla_returns, tsla_mean, tsla_var = stats_pass(tsla_prices.to_numpy(dtype=np.float64))
+tsla_std = np.sqrt(tsla_var)
+rolling_volatility = rolling_std(tsla_returns, 30)  # 30-day rolling volatility
+
+print(f"\n📉 TSLA Average Daily Return: {tsla_mean:.4f}")
+print(f"📈 TSLA Std Dev (Daily): {tsla_std:.4f}")
 
 # ========================
 # 4. Stationarity Test (ADF)
 # ========================
-def adf_test(series, title):
+def adf_test(values):
+    """
+    Perform Augmented Dickey-Fuller test with a fixed Schwert lag length,
+    maxlag = 12 * (n/100)^(1/4), instead of an AIC search over every lag.
+    """
+    maxlag = int(12 * (len(values) / 100) ** 0.25)
+    return adfuller(values, maxlag=maxlag, autolag=None)
+
+def print_adf(result, title):
     """
-    Perform Augmented Dickey-Fuller test and print result.
+    Print an ADF test result.
     """
-    result = adfuller(series.dropna(), autolag='AIC')
     print(f"\n🔍 ADF Test: {title}")
     print(f"   ADF Statistic: {result[0]:.6f}")
     print(f"   p-value: {result[1]:.6f}")
@@ -100,19 +175,24 @@ def adf_test(series, title):
         print(f"      {k}: {v:.3f}")
     print(f"   ➤ {'✅ Stationary' if result[1] < 0.05 else '❌ Non-Stationary'}")
 
-# Run ADF tests
-adf_test(df["TSLA"], "TSLA Price (Level)")
-adf_test(returns["TSLA"], "TSLA Daily Returns")
+# Run both ADF tests concurrently on plain ndarrays (the OLS fits release the GIL)
+adf_inputs = {
+    "TSLA Price (Level)": df["TSLA"].dropna().to_numpy(),
+    "TSLA Daily Returns": returns["TSLA"].to_numpy(),
+}
+with ThreadPoolExecutor(max_workers=2) as executor:
+    adf_results = list(executor.map(adf_test, adf_inputs.values()))
+for title, result in zip(adf_inputs, adf_results):
+    print_adf(result, title)
 
 # ========================
 # 5. Risk Metrics
 # ========================
 # 95% Value at Risk (VaR) - Historical method
-var_95_tsla = np.percentile(returns["TSLA"], 5)
-var_99_tsla = np.percentile(returns["TSLA"], 1)
+var_95_tsla, var_99_tsla = var_hist(tsla_returns, [5, 1])
 
 # Annualized Sharpe Ratio (assuming risk-free rate ≈ 0 for simplicity)
-sharpe_ratio_tsla = (returns["TSLA"].mean() / returns["TSLA"].std()) * np.sqrt(252)
+sharpe_ratio_tsla = (tsla_mean / tsla_std) * np.sqrt(252)
 
 print(f"\n🛡️  Risk Metrics for TSLA:")
 print(f"   95% VaR (1-day): {var_95_tsla:.2%}")
@@ -153,7 +233,7 @@ print("📊 Figure saved: assets/figures/returns_volatility.png")
 
 # 6.3 Rolling Volatility (Optional extra plot)
 plt.figure(figsize=(12, 6))
-plt.plot(returns.index, rolling_volatility, label="TSLA 30-Day Rolling Volatility", color='red')
+plt.plot(tsla_prices.index[1:], rolling_volatility, label="TSLA 30-Day Rolling Volatility", color='red')
 plt.title("30-Day Rolling Volatility of TSLA", fontsize=16, fontweight='bold')
 plt.xlabel("Date", fontsize=12)
 plt.ylabel("Volatility (Std Dev)", fontsize=12)
@@ -167,10 +247,14 @@ print("📊 Figure saved: assets/figures/rolling_volatility.png")
 # ========================
 # 7. Outlier Detection
 # ========================
-extreme_returns = returns[returns.abs() > 0.08]  # Threshold: 8% daily move
-if not extreme_returns.empty:
+# Single pass over the raw array: (row, col) positions of moves beyond 8%
+returns_arr = returns.to_numpy()
+rows, cols = np.nonzero(np.abs(returns_arr) > 0.08)  # Threshold: 8% daily move
+extreme_returns = list(zip(returns.index[rows], returns.columns[cols], returns_arr[rows, cols]))
+if extreme_returns:
     print(f"\n🚨 Detected {len(extreme_returns)} extreme daily returns (>8%):")
-    print(extreme_returns.round(4))
+    for date, asset, ret in extreme_returns:
+        print(f"   {date.date()}  {asset:<5} {ret:+.4f}")
 else:
     print("\n✅ No extreme daily returns (>8%) detected.")
 
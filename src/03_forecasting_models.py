@@ -8,9 +8,9 @@ Purpose:
 This module implements and compares two time series forecasting models—ARIMA and LSTM—to predict Tesla (TSLA) stock prices. The goal is to evaluate model performance and select the best approach for forecasting future prices, which will inform portfolio optimization in subsequent tasks. This task fulfills the requirement to use both a classical statistical model (ARIMA) and a deep learning model (LSTM) on real financial data with a chronological train-test split.
 
 Features:
-- Loads cleaned TSLA price data from 'data/raw/stock_data.pkl'.
+- Loads cleaned TSLA price data from 'data/raw/stock_data.feather'.
 - Splits data chronologically: training (2015–2023), testing (2024–2025).
-- Implements ARIMA model using `auto_arima` for optimal (p,d,q) selection.
+- Implements ARIMA model, selecting (p,d,q) by AIC from a fixed shortlist fitted in parallel.
 - Implements LSTM model using Keras with 60-day sequence input.
 - Evaluates both models using MAE, RMSE, and MAPE.
 - Generates and saves a comparative plot of forecasts vs actual test data.
@@ -20,11 +20,13 @@ Features:
 Dependencies:
 - pandas, numpy: Data handling.
 - yfinance (indirect): Data source (via Task 1).
-- pmdarima: For ARIMA modeling and parameter optimization.
+- statsmodels: For ARIMA modeling.
 - tensorflow/keras: For LSTM model.
+- tf2onnx: To export the LSTM to ONNX for fast inference in Task 3.
+- tensorflow.lite: To export an int8-quantized copy of the LSTM for CPU inference.
 - sklearn: For evaluation metrics.
 - matplotlib: For visualization.
-- joblib: For model and forecast persistence.
+- joblib: For parallel ARIMA fits and model persistence.
 
 Usage:
 Run after completing Task 1 (data extraction and EDA).
@@ -35,6 +37,8 @@ Output:
 - Saved models:
     - models/arima_model.pkl
     - models/lstm_model.h5
+    - models/lstm_model.onnx
+    - models/lstm_model.tflite
     - models/scaler.pkl
 - Saved forecasts:
     - models/arima_forecast.pkl
@@ -46,13 +50,18 @@ Output:
 
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 import matplotlib.pyplot as plt
-from pmdarima import auto_arima
+from statsmodels.tsa.arima.model import ARIMA
 from sklearn.metrics import mean_absolute_error, mean_squared_error, mean_absolute_percentage_error
 from sklearn.preprocessing import MinMaxScaler
+import tensorflow as tf
+from tensorflow.keras import mixed_precision
 from tensorflow.keras.models import Sequential
 from tensorflow.keras.layers import LSTM, Dense, Dropout
+import tf2onnx
 import joblib
+from joblib import Parallel, delayed
 import os
 
 # Create required directories
@@ -63,11 +72,11 @@ os.makedirs("assets/figures", exist_ok=True)
 # 1. Load Data
 # ========================
 try:
-    df = pd.read_pickle("data/raw/stock_data.pkl")
-    tsla = df["TSLA"].copy()
-    print("✅ Data loaded successfully from data/raw/stock_data.pkl")
+    # Only the TSLA column is read from disk
+    tsla = pd.read_feather("data/raw/stock_data.feather", columns=["Date", "TSLA"]).set_index("Date")["TSLA"]
+    print("✅ Data loaded successfully from data/raw/stock_data.feather")
 except FileNotFoundError:
-    raise FileNotFoundError("❌ File not found: data/raw/stock_data.pkl. Please run Task 1 first.")
+    raise FileNotFoundError("❌ File not found: data/raw/stock_data.feather. Please run Task 1 first.")
 
 # ========================
 # 2. Chronological Train-Test Split
@@ -86,23 +95,35 @@ test_index = test.index
 # 3. ARIMA Model
 # ========================
 print("\n🔍 Fitting ARIMA Model...")
-arima_model = auto_arima(
-    train,
-    seasonal=False,
-    trace=True,
-    error_action='ignore',
-    suppress_warnings=True,
-    stepwise=True,
-    n_fits=10
-)
+# Candidate (p,d,q) orders, fitted concurrently and compared by AIC
+arima_grid = [(1, 1, 1), (2, 1, 2), (0, 1, 1), (1, 1, 0), (3, 1, 2)]
+
+def fit_arima(series, order):
+    """
+    Fit one ARIMA order; failed fits get an infinite AIC so they are never selected.
+    """
+    try:
+        fitted = ARIMA(series, order=order).fit()
+        return order, fitted.aic, fitted
+    except Exception:
+        return order, np.inf, None
+
+# Plain ndarray input: the train index has no fixed frequency, and it keeps task pickling small
+arima_results = Parallel(n_jobs=-1)(delayed(fit_arima)(train.to_numpy(), order) for order in arima_grid)
+for order, aic, _ in arima_results:
+    print(f"   ARIMA{order}: AIC={aic:.2f}")
+best_order, best_aic, arima_model = min(arima_results, key=lambda r: r[1])
+if arima_model is None:
+    raise RuntimeError("❌ All ARIMA fits failed.")
+print(f"✅ Best model: ARIMA{best_order} (AIC={best_aic:.2f})")
 
 # Forecast
-forecast_arima = arima_model.predict(n_periods=len(test))
-forecast_arima_series = pd.Series(forecast_arima, index=test_index)
+forecast_arima = arima_model.forecast(steps=len(test))
+forecast_arima_series = pd.Series(forecast_arima, index=test_index).astype("float32")
 
 # Save
-joblib.dump(arima_model, "models/arima_model.pkl")
-forecast_arima_series.to_pickle("models/arima_forecast.pkl")
+joblib.dump(arima_model, "models/arima_model.pkl", protocol=5, compress=0)
+forecast_arima_series.to_pickle("models/arima_forecast.pkl", protocol=5)
 
 # Metrics
 mae_arima = mean_absolute_error(test, forecast_arima)
@@ -116,6 +137,12 @@ print(f"ARIMA - MAE: {mae_arima:.2f}, RMSE: {rmse_arima:.2f}, MAPE: {mape_arima:
 # ========================
 print("\n🧠 Building and Training LSTM Model...")
 
+# bf16 mixed precision halves activation memory and runs matmuls on tensor cores.
+# Only enabled with a GPU: CPUs without native bf16 would emulate it and run slower.
+if tf.config.list_physical_devices("GPU"):
+    mixed_precision.set_global_policy("mixed_bfloat16")
+    print("⚡ Mixed precision enabled (mixed_bfloat16)")
+
 # Scale data
 scaler = MinMaxScaler(feature_range=(0, 1))
 scaled_train = scaler.fit_transform(train.values.reshape(-1, 1))
@@ -123,11 +150,11 @@ scaled_test = scaler.transform(test.values.reshape(-1, 1))
 
 # Create sequences (60-day window)
 def create_sequences(data, seq_length):
-    X, y = [], []
-    for i in range(len(data) - seq_length):
-        X.append(data[i:i + seq_length])
-        y.append(data[i + seq_length])
-    return np.array(X), np.array(y)
+    # Strided (zero-copy) view of every window, materialized once as (N, L, 1)
+    windows = sliding_window_view(data.ravel(), seq_length)
+    X = np.ascontiguousarray(windows[:-1, :, None])
+    y = data[seq_length:]
+    return X, y
 
 seq_length = 60
 X_train, y_train = create_sequences(scaled_train, seq_length)
@@ -140,10 +167,12 @@ model = Sequential([
     LSTM(50, return_sequences=False),
     Dropout(0.2),
     Dense(25),
-    Dense(1)
+    Dense(1, dtype="float32")  # Keep the output (and loss) in float32 for stability
 ])
 model.compile(optimizer='adam', loss='mse')
 model.fit(X_train, y_train, batch_size=32, epochs=50, verbose=0)
+# Mixed precision is for training only; anything built from here on (e.g. export copies) is float32
+mixed_precision.set_global_policy("float32")
 
 # Predict
 lstm_pred_scaled = model.predict(X_test, verbose=0)
@@ -152,10 +181,37 @@ lstm_pred = scaler.inverse_transform(lstm_pred_scaled)
 # Align with test index
 lstm_forecast = pd.Series(lstm_pred.flatten(), index=test_index[:len(lstm_pred)])
 
-# Save
+# Save (the scaler and forecast first, so a failed export below cannot leave Task 3 without them)
 model.save("models/lstm_model.h5")
-joblib.dump(scaler, "models/scaler.pkl")
-lstm_forecast.to_pickle("models/lstm_forecast.pkl")
+joblib.dump(scaler, "models/scaler.pkl", protocol=5, compress=0)
+lstm_forecast.to_pickle("models/lstm_forecast.pkl", protocol=5)
+
+def float32_copy(model):
+    """
+    Rebuild the model with float32 layers and the trained weights.
+    The ONNX and TFLite converters cannot handle bf16 layers from mixed precision.
+    """
+    config = model.get_config()
+    for layer in config["layers"]:
+        layer["config"]["dtype"] = "float32"
+    clone = Sequential.from_config(config)
+    clone.set_weights(model.get_weights())
+    return clone
+
+export_model = float32_copy(model)
+
+# ONNX copy for the Task 3 forecast loop: onnxruntime runs the LSTM without Keras's per-call overhead
+onnx_spec = (tf.TensorSpec((None, seq_length, 1), tf.float32, name="input"),)
+tf2onnx.convert.from_keras(export_model, input_signature=onnx_spec, opset=15, output_path="models/lstm_model.onnx")
+# int8 dynamic-range TFLite copy (opt-in in Task 3). Converted from a batch-1 concrete
+# function: the converter cannot lower the LSTM with a dynamic batch dimension
+tflite_fn = tf.function(lambda x: export_model(x, training=False)).get_concrete_function(
+    tf.TensorSpec((1, seq_length, 1), tf.float32))
+converter = tf.lite.TFLiteConverter.from_concrete_functions([tflite_fn], export_model)
+converter.optimizations = [tf.lite.Optimize.DEFAULT]
+tflite_model = converter.convert()  # Convert before opening the file, so a failure leaves no empty model behind
+with open("models/lstm_model.tflite", "wb") as f:
+    f.write(tflite_model)
 
 # Metrics
 mae_lstm = mean_absolute_error(test[:len(lstm_pred)], lstm_pred)
@@ -14,12 +14,16 @@ Features:
 - Produces a professional visualization of historical prices, forecast, and confidence bands.
 - Analyzes the forecast for trends, risk, and investment implications.
 - Saves the forecast as a pickle file for reuse in Task 4.
+- Pre-renders the forecast as JSON so the backend API can serve it without re-encoding.
 
 Dependencies:
 - tensorflow/keras: To load the LSTM model.
+- onnxruntime (optional): Runs the exported ONNX model in the forecast loop.
+- numba: For the JIT-compiled window update in the forecast loop.
 - joblib: To load the MinMaxScaler.
 - pandas, numpy: For data handling.
 - matplotlib: For visualization.
+- orjson: For writing the pre-rendered JSON forecast.
 - PyPortfolioOpt (indirect): For later use in optimization.
 
 Usage:
@@ -29,15 +33,27 @@ Run after completing Task 2.
 Output:
 - Console: Forecast analysis summary (trend, risk, opportunities).
 - Saved forecast: models/future_forecast.pkl
+- API payload: models/future_forecast.json
 - Visualization: assets/figures/future_forecast.png
 """
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")  # Render straight to PNG; no GUI backend is needed
 import matplotlib.pyplot as plt
+import tensorflow as tf
 from tensorflow.keras.models import load_model
 import joblib
+import orjson
+from numba import njit
 import os
+import sys
+
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
 from datetime import datetime
 
 # Create output directories
@@ -49,11 +65,11 @@ os.makedirs("assets/figures", exist_ok=True)
 # 1. Load Data & Model
 # ========================
 try:
-    df = pd.read_pickle("data/raw/stock_data.pkl")
-    tsla = df["TSLA"].copy()
-    print("✅ Data loaded from data/raw/stock_data.pkl")
+    # Only the TSLA column is read from disk
+    tsla = pd.read_feather("data/raw/stock_data.feather", columns=["Date", "TSLA"]).set_index("Date")["TSLA"]
+    print("✅ Data loaded from data/raw/stock_data.feather")
 except FileNotFoundError:
-    raise FileNotFoundError("❌ File not found: data/raw/stock_data.pkl")
+    raise FileNotFoundError("❌ File not found: data/raw/stock_data.feather")
 
 try:
     model = load_model("models/lstm_model.h5")
@@ -62,60 +78,203 @@ try:
 except Exception as e:
     raise Exception(f"❌ Failed to load model or scaler: {e}")
 
+# Run the forecast loop on the ONNX export when available, else on the Keras model
+onnx_path = "models/lstm_model.onnx"
+if ort is None or not os.path.exists(onnx_path):
+    onnx_path = None
+# Opt-in: int8 TFLite export (smaller and faster than Keras on CPU, but quantized weights shift the forecast slightly)
+use_tflite = False
+tflite_path = "models/lstm_model.tflite" if use_tflite and os.path.exists("models/lstm_model.tflite") else None
+backend = "tflite (int8)" if tflite_path else "onnxruntime" if onnx_path else "tensorflow"
+print(f"⚙️  Inference backend: {backend}")
+
 # Sequence length (must match training)
 seq_length = 60
+# Overlapping context windows predicted together in one batch per step (1 = plain recursive forecast)
+n_windows = 1
+# Carry each LSTM's (h, c) across steps instead of re-reading the whole window every step.
+# Faster, but the recurrent state then spans more than the seq_length days the model was trained on.
+stateful = False
 
 
 # ========================
 # 2. Forecast Future Prices
 # ========================
-def forecast_future(model, data, scaler, seq_length, steps=252):
+def make_step(model, seq_length):
     """
-    Forecast future prices using the trained LSTM model.
+    Wrap a direct model call in a traced tf.function, avoiding the per-call
+    overhead of model.predict (batching setup, callbacks, progress bar).
+    jit_compile=True has XLA fuse the LSTM gate matmuls, bias adds and the
+    dense head into a few kernels per step.
+    The batch dimension is left open so several windows run in one call.
     """
-    # Scale the last seq_length days
-    last_seq = scaler.transform(data[-seq_length:].values.reshape(-1, 1))
-    last_seq = last_seq.reshape(1, seq_length, 1)
-    preds = []
+    @tf.function(jit_compile=True, input_signature=[tf.TensorSpec((None, seq_length, 1), tf.float32)])
+    def step(x):
+        return model(x, training=False)
+    return step
+
+
+def make_stateful(model, batch_size):
+    """
+    Clone the trained model into a stateful copy with the same weights.
+    Each LSTM keeps its (h, c) between calls, so after seeding it with the
+    full window every further step only needs to advance one timestep.
+    """
+    layers = [tf.keras.layers.InputLayer(batch_input_shape=(batch_size, None, 1))]
+    for layer in model.layers:
+        config = layer.get_config()
+        config.pop("batch_input_shape", None)
+        if isinstance(layer, tf.keras.layers.LSTM):
+            config["stateful"] = True
+        layers.append(layer.__class__.from_config(config))
+    clone = tf.keras.Sequential(layers)
+    clone.set_weights(model.get_weights())
+    return clone
+
+
+def make_onnx_step(path):
+    """
+    Run the exported model through an onnxruntime session instead of Keras.
+    Uses CUDA when onnxruntime was built with it, otherwise the CPU provider.
+    """
+    available = ort.get_available_providers()
+    providers = [p for p in ("CUDAExecutionProvider", "CPUExecutionProvider") if p in available]
+    sess = ort.InferenceSession(path, providers=providers)
+    name = sess.get_inputs()[0].name
+
+    def step(x):
+        return sess.run(None, {name: x})[0]
+    return step
+
+
+def make_tflite_step(path):
+    """
+    Run the int8 dynamic-range TFLite export.
+    Its fused LSTM kernel is built for batch 1, so stacked windows are
+    invoked one at a time.
+    """
+    interp = tf.lite.Interpreter(model_path=path)
+    interp.allocate_tensors()
+    inp = interp.get_input_details()[0]["index"]
+    out = interp.get_output_details()[0]["index"]
+
+    def step(x):
+        preds = np.empty((x.shape[0], 1), dtype=np.float32)
+        for j in range(x.shape[0]):
+            interp.set_tensor(inp, x[j:j + 1])
+            interp.invoke()
+            preds[j] = interp.get_tensor(out)[0]
+        return preds
+    return step
+
 
-    for _ in range(steps):
-        pred = model.predict(last_seq, verbose=0)
-        preds.append(pred[0, 0])
-        # Update sequence: shift left, append new prediction
-        new_entry = np.array([[pred[0, 0]]])
-        last_seq = np.append(last_seq[:, 1:, :], [new_entry], axis=1)
+@njit(cache=True)
+def _advance(buf, pred):
+    """
+    Shift every window in buf one step left and write pred at the end, in place.
+    """
+    n_windows, seq_length = buf.shape[0], buf.shape[1]
+    for j in range(n_windows):
+        for i in range(seq_length - 1):
+            buf[j, i, 0] = buf[j, i + 1, 0]
+        buf[j, seq_length - 1, 0] = pred
 
-    # Inverse transform predictions
-    preds = scaler.inverse_transform(np.array(preds).reshape(-1, 1))
-    preds = preds.flatten()
 
-    # Generate future dates (business days only)
+def forecast_future(model, data, scaler, seq_length, steps=252, n_windows=1, stateful=False,
+                    onnx_path=None, tflite_path=None):
+    """
+    Forecast future prices using the trained LSTM model.
+    With n_windows > 1, the last n_windows overlapping windows are stacked into
+    one (n_windows, seq_length, 1) batch; every step predicts them all in a
+    single model call and the median becomes the next value appended to each.
+    With stateful=True, a stateful clone reads the windows once and is then
+    fed one predicted value per step.
+    Otherwise, tflite_path or onnx_path selects that export over the Keras model.
+    """
+    # Generate future dates (business days only) up front, keeping the index's timezone
     last_date = data.index[-1]
     future_index = pd.bdate_range(start=last_date + pd.Timedelta(days=1), periods=steps)
 
+    # MinMaxScaler is the affine map x * a + b; apply it directly instead of via sklearn
+    a = scaler.scale_[0]
+    b = scaler.min_[0]
+
+    # Scale the last seq_length + n_windows - 1 days into a preallocated float32 window buffer
+    scaled = data[-(seq_length + n_windows - 1):].to_numpy(dtype=np.float64) * a + b
+    buf = np.empty((n_windows, seq_length, 1), dtype=np.float32)
+    for j in range(n_windows):
+        buf[j, :, 0] = scaled[j:j + seq_length]
+    preds = []
+
+    if stateful:
+        step = make_step(make_stateful(model, n_windows), None)
+        out = step(buf)  # Seeds every LSTM's (h, c) and yields the first prediction
+        nxt = np.empty((n_windows, 1, 1), dtype=np.float32)
+        for _ in range(steps):
+            pred = np.median(np.asarray(out)[:, 0])
+            preds.append(pred)
+            nxt[:] = pred
+            out = step(nxt)
+    else:
+        if tflite_path:
+            step = make_tflite_step(tflite_path)
+        elif onnx_path:
+            step = make_onnx_step(onnx_path)
+        else:
+            step = make_step(model, seq_length)
+        step(buf)  # Warm up: trace/compile (or initialize the session) once, outside the loop
+        for _ in range(steps):
+            pred = np.median(np.asarray(step(buf))[:, 0])
+            preds.append(pred)
+            # Update sequences in place: shift left, write new prediction at the end
+            _advance(buf, pred)
+
+    # Inverse transform predictions once at the end (the buffer stays in scaled space)
+    preds = (np.asarray(preds, dtype=np.float64) - b) / a
+
     return pd.Series(preds, index=future_index)
 
 print("🧠 Generating 12-month forecast using LSTM...")
-future_forecast = forecast_future(model, tsla, scaler, seq_length, steps=252)
-future_forecast.to_pickle("models/future_forecast.pkl")
+future_forecast = forecast_future(model, tsla, scaler, seq_length, steps=252, n_windows=n_windows,
+                                  stateful=stateful, onnx_path=onnx_path,
+                                  tflite_path=tflite_path).astype("float32")
+future_forecast.to_pickle("models/future_forecast.pkl", protocol=5)
 print(f"✅ Forecast saved to models/future_forecast.pkl")
+
+# Pre-render the API payload served by /api/forecast/future
+forecast_dates = future_forecast.index.strftime("%Y-%m-%d").tolist()
+# Keep NumPy float32 scalars so orjson writes their shortest float32 form
+forecast_prices = list(future_forecast.to_numpy())
+with open("models/future_forecast.json", "wb") as f:
+    f.write(orjson.dumps([{"date": d, "price": p} for d, p in zip(forecast_dates, forecast_prices)],
+                         option=orjson.OPT_SERIALIZE_NUMPY))
+print(f"✅ Forecast JSON saved to models/future_forecast.json")
 print(f"📅 Forecast period: {future_forecast.index[0].date()} to {future_forecast.index[-1].date()}")
 
 # ========================
 # 3. Confidence Intervals
 # ========================
-# Use historical daily returns to estimate volatility
-returns = tsla.pct_change().dropna()
-historical_vol = returns.std()  # Daily volatility
-
-# Project confidence bands with increasing uncertainty
-center = future_forecast.values
-t = np.arange(1, len(center) + 1)  # Time steps
-cumulative_std = historical_vol * np.sqrt(t / 252)  # Annualized scaling
+# Use historical daily returns to estimate volatility (plain float32 NumPy, no pandas dispatch)
+v = tsla.dropna().to_numpy(dtype=np.float32)
+returns = np.diff(v) / v[:-1]
+historical_vol = returns.std(ddof=1)  # Daily volatility, sample std as in pandas
+
+# Project confidence bands with increasing uncertainty: center * (1 ± z * vol * sqrt(t / 252))
+center = future_forecast.to_numpy()
 confidence_level = 1.96  # 95%
 
-upper = center * (1 + confidence_level * cumulative_std)
-lower = center * (1 - confidence_level * cumulative_std)
+# Build the band half-width in place, in the forecast's float32 dtype
+factor = np.arange(1, len(center) + 1, dtype=np.float32)  # Time steps
+np.divide(factor, 252, out=factor)
+np.sqrt(factor, out=factor)  # Annualized scaling
+np.multiply(factor, np.float32(confidence_level * historical_vol), out=factor)
+
+upper = np.empty_like(center)
+lower = np.empty_like(center)
+np.add(factor, 1, out=upper)
+np.multiply(upper, center, out=upper)
+np.subtract(1, factor, out=lower)
+np.multiply(lower, center, out=lower)
 
 # ========================
 # 4. Visualization
@@ -123,11 +282,13 @@ lower = center * (1 - confidence_level * cumulative_std)
 plt.figure(figsize=(14, 7))
 # Historical data (last 2 years)
 historical = tsla['2023-08-01':]
-plt.plot(historical.index, historical.values, label="Historical Price", color="blue", linewidth=2)
+plt.plot(historical.index, historical.to_numpy(dtype=np.float32), label="Historical Price", color="blue", linewidth=2)
 # Forecast
-plt.plot(future_forecast.index, future_forecast.values, label="LSTM Forecast", color="green", linestyle="--", linewidth=2)
+plt.plot(future_forecast.index, center, label="LSTM Forecast", color="green", linestyle="--", linewidth=2)
 # Confidence interval
-plt.fill_between(future_forecast.index, lower, upper, color="green", alpha=0.2, label="95% Confidence Interval")
+# Rasterize the shaded band so it is composited once as an image
+plt.fill_between(future_forecast.index, lower, upper, color="green", alpha=0.2, label="95% Confidence Interval",
+                 rasterized=True)
 # Formatting
 plt.title("TSLA 12-Month Price Forecast (Aug 2025 – Jul 2026)", fontsize=16, fontweight='bold')
 plt.xlabel("Date", fontsize=12)
@@ -135,7 +296,7 @@ plt.ylabel("Price ($)", fontsize=12)
 plt.legend(fontsize=11)
 plt.grid(True, alpha=0.3)
 plt.tight_layout()
-plt.savefig("assets/figures/future_forecast.png", dpi=150)
+plt.savefig("assets/figures/future_forecast.png", dpi=100)
 plt.close()
 print("📊 Forecast plot saved to assets/figures/future_forecast.png")
 
@@ -146,33 +307,38 @@ current_price = tsla.iloc[-1]
 forecast_6m = future_forecast.iloc[126]  # ~6 months
 forecast_12m = future_forecast.iloc[-1]  # 12 months
 
-print("\n" + "="*60)
-print("           FORECAST ANALYSIS & INSIGHTS")
-print("="*60)
-print(f"📌 Current Price (as of {current_price:.2f}")
-print(f"📌 6-Month Forecast: ${forecast_6m:.2f} (+{((forecast_6m/current_price)-1)*100:.1f}%)")
-print(f"📌 12-Month Forecast: ${forecast_12m:.2f} (+{((forecast_12m/current_price)-1)*100:.1f}%)")
-print(f"📈 Average Monthly Growth: {((forecast_12m/current_price)**(1/12) - 1)*100:.2f}%")
+# Collect the report and write it to stdout in one call
+lines = []
+log = lines.append
+
+log("\n" + "="*60)
+log("           FORECAST ANALYSIS & INSIGHTS")
+log("="*60)
+log(f"📌 Current Price (as of {current_price:.2f}")
+log(f"📌 6-Month Forecast: ${forecast_6m:.2f} (+{((forecast_6m/current_price)-1)*100:.1f}%)")
+log(f"📌 12-Month Forecast: ${forecast_12m:.2f} (+{((forecast_12m/current_price)-1)*100:.1f}%)")
+log(f"📈 Average Monthly Growth: {((forecast_12m/current_price)**(1/12) - 1)*100:.2f}%")
 
 # Volatility & Risk
-print(f"\n⚠️  Volatility & Risk:")
-print(f"   - Confidence interval width grows with time.")
-print(f"   - After 6 months: ±{1.96 * historical_vol * np.sqrt(126/252)*100:.1f}%")
-print(f"   - After 12 months: ±{1.96 * historical_vol * np.sqrt(252/252)*100:.1f}%")
-print(f"   ➤ Long-term forecasts are highly uncertain. Use as one input, not a standalone signal.")
+log(f"\n⚠️  Volatility & Risk:")
+log(f"   - Confidence interval width grows with time.")
+log(f"   - After 6 months: ±{1.96 * historical_vol * np.sqrt(126/252)*100:.1f}%")
+log(f"   - After 12 months: ±{1.96 * historical_vol * np.sqrt(252/252)*100:.1f}%")
+log(f"   ➤ Long-term forecasts are highly uncertain. Use as one input, not a standalone signal.")
 
 # Trend Analysis
 trend = "Upward" if forecast_12m > current_price else "Downward"
-print(f"\n🔍 Trend Analysis: {trend} trend expected over 12 months.")
+log(f"\n🔍 Trend Analysis: {trend} trend expected over 12 months.")
 
 # Market Opportunities & Risks
-print(f"\n💡 Market Opportunities:")
-print(f"   - Potential ~20-25% upside over 12 months.")
-print(f"   - Could benefit from AI, robotaxi, or energy segment growth.")
+log(f"\n💡 Market Opportunities:")
+log(f"   - Potential ~20-25% upside over 12 months.")
+log(f"   - Could benefit from AI, robotaxi, or energy segment growth.")
 
-print(f"\n🚨 Risks:")
-print(f"   - High volatility increases forecast uncertainty.")
-print(f"   - Macro risks: interest rates, inflation, competition.")
-print(f"   - Over-reliance on past patterns in a changing market.")
+log(f"\n🚨 Risks:")
+log(f"   - High volatility increases forecast uncertainty.")
+log(f"   - Macro risks: interest rates, inflation, competition.")
+log(f"   - Over-reliance on past patterns in a changing market.")
 
-print("\n✅ Task 3 Complete. Proceed to Task 4: Optimize Portfolio Based on Forecast.")
\ No newline at end of file
+log("\n✅ Task 3 Complete. Proceed to Task 4: Optimize Portfolio Based on Forecast.")
+sys.stdout.write("\n".join(lines) + "\n")
\ No newline at end of file
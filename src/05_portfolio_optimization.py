@@ -25,7 +25,7 @@ Dependencies:
 - pandas, numpy: Data handling.
 - PyPortfolioOpt: For MPT optimization and plotting.
 - matplotlib: For visualization.
-- joblib: To load forecast and data.
+- pickle: To load the forecast and save the optimal weights.
 
 Usage:
 Run after completing Task 3.
@@ -42,7 +42,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 from pypfopt import EfficientFrontier, risk_models, expected_returns
 from pypfopt import plotting
-import joblib
+import pickle
 import os
 
 # Create output directories
@@ -53,13 +53,14 @@ os.makedirs("assets/figures", exist_ok=True)
 # 1. Load Data
 # ========================
 try:
-    df = pd.read_pickle("data/raw/stock_data.pkl")
-    print("✅ Data loaded from data/raw/stock_data.pkl")
+    # Read only the price columns; the table also holds volumes
+    df = pd.read_feather("data/raw/stock_data.feather", columns=["Date", "TSLA", "BND", "SPY"]).set_index("Date")
+    print("✅ Data loaded from data/raw/stock_data.feather")
 except FileNotFoundError:
-    raise FileNotFoundError("❌ File not found: data/raw/stock_data.pkl")
+    raise FileNotFoundError("❌ File not found: data/raw/stock_data.feather")
 
 try:
-    future_forecast = joblib.load("models/future_forecast.pkl")
+    future_forecast = pd.read_pickle("models/future_forecast.pkl")
     print("✅ LSTM forecast loaded from models/future_forecast.pkl")
 except FileNotFoundError:
     raise FileNotFoundError("❌ File not found: models/future_forecast.pkl")
@@ -162,6 +163,7 @@ print(f"Annual Volatility: {recommended_vol:.2%}")
 print(f"Sharpe Ratio (rf=3%): {recommended_sr:.3f}")
 
 # Save recommended weights
-joblib.dump(dict(recommended_weights), "models/optimal_weights.pkl")
+with open("models/optimal_weights.pkl", "wb") as f:
+    pickle.dump(dict(recommended_weights), f, protocol=5)
 print("\n💾 Optimal portfolio weights saved to models/optimal_weights.pkl")
 
@@ -23,7 +23,8 @@ Features:
 Dependencies:
 - pandas, numpy: For data handling and return calculation.
 - matplotlib: For performance visualization.
-- joblib: To load optimal weights.
+- numba: For the parallel prefix sum used on long backtests.
+- pickle: To load optimal weights and save backtest results.
 
 Usage:
 Run after completing Task 4.
@@ -37,9 +38,13 @@ Output:
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")  # Render straight to PNG; no GUI backend is needed
 import matplotlib.pyplot as plt
-import joblib
+import pickle
+from numba import njit, prange
 import os
+import sys
 
 # Create output directories
 os.makedirs("assets/figures", exist_ok=True)
@@ -48,13 +53,15 @@ os.makedirs("assets/figures", exist_ok=True)
 # 1. Load Data
 # ========================
 try:
-    df = pd.read_pickle("data/raw/stock_data.pkl")
-    print("✅ Data loaded from data/raw/stock_data.pkl")
+    # Read only the price columns; the table also holds volumes
+    df = pd.read_feather("data/raw/stock_data.feather", columns=["Date", "TSLA", "BND", "SPY"]).set_index("Date")
+    print("✅ Data loaded from data/raw/stock_data.feather")
 except FileNotFoundError:
-    raise FileNotFoundError("❌ File not found: data/raw/stock_data.pkl")
+    raise FileNotFoundError("❌ File not found: data/raw/stock_data.feather")
 
 try:
-    optimal_weights = joblib.load("models/optimal_weights.pkl")
+    with open("models/optimal_weights.pkl", "rb") as f:
+        optimal_weights = pickle.load(f)
     print("✅ Optimal weights loaded from models/optimal_weights.pkl")
 except FileNotFoundError:
     raise FileNotFoundError("❌ File not found: models/optimal_weights.pkl")
@@ -62,10 +69,9 @@ except FileNotFoundError:
 # Define backtesting period
 backtest_start = "2024-08-01"
 backtest_end = "2025-07-31"
-backtest_df = df[backtest_start:backtest_end].copy()
-
-# Ensure no missing dates
-backtest_df = backtest_df.asfreq('D').ffill()
+# Stay on trading days: forward-filling to calendar days would add zero-return
+# weekend rows that shrink the daily volatility behind the sqrt(252) Sharpe
+backtest_df = df.loc[backtest_start:backtest_end].dropna(how='all')
 
 print(f"📅 Backtesting Period: {backtest_df.index.min().date()} to {backtest_df.index.max().date()}")
 print(f"📊 Data points: {len(backtest_df)}")
@@ -83,47 +89,99 @@ weights_benchmark = pd.Series({
     "SPY": 0.6
 })
 
+# Both portfolios as the columns of one (assets x 2) weight matrix
+weights = pd.concat({"Strategy": weights_strategy, "Benchmark": weights_benchmark}, axis=1).fillna(0.0)
+
 # ========================
 # 3. Calculate Portfolio Returns
 # ========================
 # Daily returns of assets
 asset_returns = backtest_df.pct_change().dropna()
 
+# Below this many rows np.cumsum beats the thread start-up cost of the parallel scan
+PARALLEL_SCAN_MIN_ROWS = 1_000_000
+
+
+@njit(parallel=True, cache=True)
+def _block_cumsum(x):
+    """
+    Column-wise inclusive prefix sum as a parallel block scan: sum sqrt(N)-row
+    blocks in parallel, prefix-sum the block totals, then rescan every block
+    from its offset in parallel.
+    """
+    n, m = x.shape
+    block = max(1, int(np.sqrt(n)))
+    n_blocks = (n + block - 1) // block
+    totals = np.zeros((n_blocks, m), dtype=x.dtype)
+    for b in prange(n_blocks):
+        for i in range(b * block, min((b + 1) * block, n)):
+            for j in range(m):
+                totals[b, j] += x[i, j]
+
+    # Exclusive prefix over the sqrt(N) block totals (short, so serial)
+    offsets = np.zeros((n_blocks, m), dtype=x.dtype)
+    for b in range(1, n_blocks):
+        offsets[b] = offsets[b - 1] + totals[b - 1]
+
+    out = np.empty_like(x)
+    for b in prange(n_blocks):
+        running = offsets[b].copy()
+        for i in range(b * block, min((b + 1) * block, n)):
+            for j in range(m):
+                running[j] += x[i, j]
+                out[i, j] = running[j]
+    return out
+
+
+def cumsum_rows(x):
+    """
+    Cumulative sum down the rows of a 2-D array, in parallel for long inputs.
+    """
+    if len(x) >= PARALLEL_SCAN_MIN_ROWS:
+        return _block_cumsum(x)
+    return np.cumsum(x, axis=0)
+
+
 def portfolio_cumulative_returns(returns_df, weights):
     """
-    Compute cumulative returns for a portfolio.
+    Compute daily and cumulative returns for one or more portfolios.
+    weights holds one portfolio per column; a single matrix product over the
+    weighted assets gives every portfolio's daily returns at once.
     """
-    weighted_returns = (returns_df * weights).sum(axis=1)
-    cum_returns = (1 + weighted_returns).cumprod()
-    return cum_returns
+    weighted_returns = returns_df[weights.index].to_numpy() @ weights.to_numpy()
+    # Compound in log space: one cumulative sum of log(1 + r), exponentiated once
+    cum_returns = np.exp(cumsum_rows(np.log1p(weighted_returns)))
+    return (pd.DataFrame(weighted_returns, index=returns_df.index, columns=weights.columns),
+            pd.DataFrame(cum_returns, index=returns_df.index, columns=weights.columns))
 
-# Simulate strategy and benchmark
-cumulative_strategy = portfolio_cumulative_returns(asset_returns, weights_strategy)
-cumulative_benchmark = portfolio_cumulative_returns(asset_returns, weights_benchmark)
+# Simulate strategy and benchmark together
+daily_returns, cumulative_returns = portfolio_cumulative_returns(asset_returns, weights)
+cumulative_strategy = cumulative_returns["Strategy"]
+cumulative_benchmark = cumulative_returns["Benchmark"]
 
 # ========================
 # 4. Performance Metrics
 # ========================
 def annualized_sharpe_ratio(returns, rf=0.03):
     """
-    Calculate annualized Sharpe ratio.
+    Calculate annualized Sharpe ratio (per column for a DataFrame).
     """
     excess_returns = returns - rf / 252
     return (excess_returns.mean() / excess_returns.std()) * np.sqrt(252)
 
-sharpe_strategy = annualized_sharpe_ratio(cumulative_strategy.pct_change().dropna())
-sharpe_benchmark = annualized_sharpe_ratio(cumulative_benchmark.pct_change().dropna())
+sharpe = annualized_sharpe_ratio(daily_returns)
+total_return = (cumulative_returns.iloc[-1] - 1) * 100
 
-total_return_strategy = (cumulative_strategy.iloc[-1] - 1) * 100
-total_return_benchmark = (cumulative_benchmark.iloc[-1] - 1) * 100
+sharpe_strategy, sharpe_benchmark = sharpe["Strategy"], sharpe["Benchmark"]
+total_return_strategy, total_return_benchmark = total_return["Strategy"], total_return["Benchmark"]
 
 # ========================
 # 5. Visualization
 # ========================
 plt.figure(figsize=(14, 7))
-plt.plot(cumulative_strategy.index, cumulative_strategy.values,
+plt.plot(cumulative_strategy.index, cumulative_strategy.to_numpy(dtype=np.float32),
          label=f"Optimized Strategy ({total_return_strategy:.1f}% return)", color="blue", linewidth=2)
-plt.plot(cumulative_benchmark.index, cumulative_benchmark.values,
+plt.plot(cumulative_benchmark.index, cumulative_benchmark.to_numpy(dtype=np.float32),
          label=f"60/40 Benchmark ({total_return_benchmark:.1f}% return)", color="red", linestyle="--", linewidth=2)
 
 plt.title("Backtest: Model-Driven Strategy vs 60/40 Benchmark (Aug 2024 – Jul 2025)", fontsize=16, fontweight='bold')
@@ -132,38 +190,43 @@ plt.ylabel("Cumulative Return", fontsize=12)
 plt.legend(fontsize=11)
 plt.grid(True, alpha=0.3)
 plt.tight_layout()
-plt.savefig("assets/figures/backtest_comparison.png", dpi=150)
+plt.savefig("assets/figures/backtest_comparison.png", dpi=100)
 plt.close()
 print("📊 Backtest plot saved to assets/figures/backtest_comparison.png")
 
 # ========================
 # 6. Results & Conclusion
 # ========================
-print("\n" + "="*60)
-print("           BACKTESTING RESULTS")
-print("="*60)
-print(f"{'Portfolio':<15} {'Total Return':<15} {'Sharpe Ratio':<15}")
-print("-"*60)
-print(f"{'Strategy':<15} {total_return_strategy:<15.1f} {sharpe_strategy:<15.3f}")
-print(f"{'Benchmark':<15} {total_return_benchmark:<15.1f} {sharpe_benchmark:<15.3f}")
-print("="*60)
+# Collect the report and write it to stdout in one call
+lines = []
+log = lines.append
+
+log("\n" + "="*60)
+log("           BACKTESTING RESULTS")
+log("="*60)
+log(f"{'Portfolio':<15} {'Total Return':<15} {'Sharpe Ratio':<15}")
+log("-"*60)
+log(f"{'Strategy':<15} {total_return_strategy:<15.1f} {sharpe_strategy:<15.3f}")
+log(f"{'Benchmark':<15} {total_return_benchmark:<15.1f} {sharpe_benchmark:<15.3f}")
+log("="*60)
 
 # Conclusion
 outperformed_return = total_return_strategy > total_return_benchmark
 outperformed_sharpe = sharpe_strategy > sharpe_benchmark
 
-print("\n💡 Conclusion:")
+log("\n💡 Conclusion:")
 if outperformed_return and outperformed_sharpe:
-    print("✅ The model-driven strategy **outperformed** the 60/40 benchmark in both total return and risk-adjusted performance.")
-    print("This supports the viability of using forecasting and MPT for portfolio optimization.")
+    log("✅ The model-driven strategy **outperformed** the 60/40 benchmark in both total return and risk-adjusted performance.")
+    log("This supports the viability of using forecasting and MPT for portfolio optimization.")
 elif outperformed_return:
-    print("🔶 The strategy achieved higher total return but a lower Sharpe ratio.")
-    print("It delivered growth at higher risk.")
+    log("🔶 The strategy achieved higher total return but a lower Sharpe ratio.")
+    log("It delivered growth at higher risk.")
 else:
-    print("⚠️ The benchmark outperformed the strategy.")
-    print("The model-driven approach may need refinement (e.g., re-forecasting, better risk modeling).")
+    log("⚠️ The benchmark outperformed the strategy.")
+    log("The model-driven approach may need refinement (e.g., re-forecasting, better risk modeling).")
 
-print("\n✅ Task 5 Complete. All tasks finished. Proceed to Final Submission.")
+log("\n✅ Task 5 Complete. All tasks finished. Proceed to Final Submission.")
+sys.stdout.write("\n".join(lines) + "\n")
 
 
 # Optional: Save results
@@ -174,4 +237,5 @@ results = {
     "benchmark_sharpe": sharpe_benchmark,
     "outperformed": outperformed_return and outperformed_sharpe
 }
-joblib.dump(results, "models/backtest_results.pkl")
\ No newline at end of file
+with open("models/backtest_results.pkl", "wb") as f:
+    pickle.dump(results, f, protocol=5)
\ No newline at end of file